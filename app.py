@@ -103,32 +103,24 @@ heatmap_volatility_range = st.sidebar.slider(
 # Body
 st.title("📊 Black-Scholes Option Pricer")
 
-bs_call = BlackScholes(S, K, T, r, sigma, q)
-bs_put = BlackScholes(S, K, T, r, sigma, q)
-call_price = bs_call.calculate_option_price("call")
-put_price = bs_put.calculate_option_price("put")
-call_greeks = bs_call.calculate_greeks()
-put_greeks = bs_put.calculate_greeks()
+bs = BlackScholes(S, K, T, r, sigma, q)
+call_price = bs.calculate_option_price("call")
+put_price = bs.calculate_option_price("put")
+greeks = bs.calculate_greeks()
 
 col1, col2 = st.columns(2)
 
 
-def display_greeks(greeks, option_type):
-    greek_symbols = {
-        "delta": "Δ (Delta)",
-        "gamma": "Γ (Gamma)",
-        "vega": "ν (Vega)",
-        "theta": "Θ (Theta)",
-        "rho": "ρ (Rho)",
-    }
+GREEK_KEYS = {
+    "call": ["delta_call", "gamma", "vega", "theta_call", "rho_call"],
+    "put": ["delta_put", "gamma", "vega", "theta_put", "rho_put"],
+}
+GREEK_SYMBOLS = pd.Index(["Δ (Delta)", "Γ (Gamma)", "ν (Vega)", "Θ (Theta)", "ρ (Rho)"], name="Greek")
 
-    greek_data = {
-        greek_symbols[g.split("_")[0]]: f"{v:.4f}"
-        for g, v in greeks.items()
-        if g.endswith(option_type) or g == "gamma" or g == "vega"
-    }
 
-    return pd.DataFrame(greek_data.items(), columns=["Greek", "Value"]).set_index("Greek")
+def display_greeks(greeks, option_type):
+    values = np.fromiter((greeks[g] for g in GREEK_KEYS[option_type]), dtype=float, count=len(GREEK_SYMBOLS))
+    return pd.DataFrame({"Value": np.char.mod("%.4f", values)}, index=GREEK_SYMBOLS)
 
 
 def get_pricing_status(purchase_price, model_price, threshold=0.01):
@@ -148,7 +140,7 @@ with col1:
     st.metric("Price", f"${call_price:.2f}", delta=None)
 
     st.write("Call Greeks")
-    st.table(display_greeks(call_greeks, "call"))
+    st.table(display_greeks(greeks, "call"))
 
     call_pnl = call_price - call_purchase_price
     status = get_pricing_status(call_purchase_price, call_price)
@@ -165,7 +157,7 @@ with col2:
     st.metric("Price", f"${put_price:.2f}", delta=None)
 
     st.write("Put Greeks")
-    st.table(display_greeks(put_greeks, "put"))
+    st.table(display_greeks(greeks, "put"))
 
     put_pnl = put_price - put_purchase_price
     status = get_pricing_status(put_purchase_price, put_price)
@@ -187,12 +179,12 @@ sigma_range = np.linspace(
     50,
 )
 
-call_prices = np.array(
-    [[BlackScholes(s, K, T, r, sig, q).calculate_option_price("call") for s in S_range] for sig in sigma_range]
-)
-put_prices = np.array(
-    [[BlackScholes(s, K, T, r, sig, q).calculate_option_price("put") for s in S_range] for sig in sigma_range]
-)
+S_grid, sigma_grid = np.meshgrid(S_range, sigma_range)
+bs_grid = BlackScholes(S_grid, K, T, r, sigma_grid, q)
+call_prices = bs_grid.calculate_option_price("call")
+put_prices = np.maximum(call_prices - S_grid * np.exp(-q * T) + K * np.exp(-r * T), 0)  # put-call parity
+call_prices = call_prices.astype(np.float32, copy=False)
+put_prices = put_prices.astype(np.float32, copy=False)
 
 call_pnl = call_prices - call_purchase_price
 put_pnl = put_prices - put_purchase_price
@@ -207,10 +199,10 @@ st.markdown("---")
 
 st.subheader("Profit/Loss Chart")
 S_range = np.linspace(0.5 * K, 1.5 * K, 100)  # type: ignore
-call_pnl_range = [max(s - K, 0) - call_purchase_price for s in S_range]
-put_pnl_range = [max(K - s, 0) - put_purchase_price for s in S_range]
-call_break_even = S_range[np.argmin(np.abs(call_pnl_range))]
-put_break_even = S_range[np.argmin(np.abs(put_pnl_range))]
+call_pnl_range = np.maximum(S_range - K, 0) - call_purchase_price
+put_pnl_range = np.maximum(K - S_range, 0) - put_purchase_price
+call_break_even = K + call_purchase_price
+put_break_even = K - put_purchase_price
 col1, col2 = st.columns(2)
 with col1:
     st.plotly_chart(create_profit_loss_chart(S_range, call_pnl_range, call_break_even, "Call Option P&L"))
@@ -220,14 +212,9 @@ with col2:
 st.markdown("---")
 
 st.subheader("Greeks")
-call_greeks_values = {
-    greek: [BlackScholes(s, K, T, r, sigma, q).calculate_greeks()[greek] for s in S_range]
-    for greek in ["delta_call", "gamma", "vega", "theta_call", "rho_call"]
-}
-put_greeks_values = {
-    greek: [BlackScholes(s, K, T, r, sigma, q).calculate_greeks()[greek] for s in S_range]
-    for greek in ["delta_put", "gamma", "vega", "theta_put", "rho_put"]
-}
+greeks_range = BlackScholes(S_range, K, T, r, sigma, q).calculate_greeks()
+call_greeks_values = {greek: greeks_range[greek] for greek in GREEK_KEYS["call"]}
+put_greeks_values = {greek: greeks_range[greek] for greek in GREEK_KEYS["put"]}
 col1, col2 = st.columns(2)
 with col1:
     st.plotly_chart(create_greeks_plot(S_range, call_greeks_values, "Call Option Greeks"))
@@ -1,45 +1,57 @@
+from functools import cached_property
+
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 
 
 class BlackScholes:
     def __init__(self, s, k, t, r, sigma, q=0.0):
         self.s, self.k, self.t, self.r, self.sigma, self.q = s, k, t, r, sigma, q
 
-    def calculate_option_price(self, option_type="call"):
+    @cached_property
+    def _d1_d2(self):
         d1 = (np.log(self.s / self.k) + (self.r - self.q + 0.5 * self.sigma**2) * self.t) / (
             self.sigma * np.sqrt(self.t)
         )
         d2 = d1 - self.sigma * np.sqrt(self.t)
+        return d1, d2
+
+    def calculate_option_price(self, option_type="call"):
+        d1, d2 = self._d1_d2
 
         if option_type == "call":
-            price = self.s * np.exp(-self.q * self.t) * norm.cdf(d1) - self.k * np.exp(-self.r * self.t) * norm.cdf(d2)
+            price = self.s * np.exp(-self.q * self.t) * ndtr(d1) - self.k * np.exp(-self.r * self.t) * ndtr(d2)
         else:
-            price = self.k * np.exp(-self.r * self.t) * norm.cdf(-d2) - self.s * np.exp(-self.q * self.t) * norm.cdf(
-                -d1
-            )
+            price = self.k * np.exp(-self.r * self.t) * ndtr(-d2) - self.s * np.exp(-self.q * self.t) * ndtr(-d1)
 
         return price
 
     def calculate_greeks(self):
-        d1 = (np.log(self.s / self.k) + (self.r - self.q + 0.5 * self.sigma**2) * self.t) / (
-            self.sigma * np.sqrt(self.t)
+        d1, d2 = self._d1_d2
+
+        sqrt_t = np.sqrt(self.t)
+        dividend_discount = np.exp(-self.q * self.t)
+        rate_discount = np.exp(-self.r * self.t)
+        pdf_d1 = np.exp(-0.5 * d1 * d1) / np.sqrt(2 * np.pi)
+        cdf_d1, cdf_d2 = ndtr(d1), ndtr(d2)
+        theta_decay = -self.s * dividend_discount * pdf_d1 * self.sigma / (2 * sqrt_t)
+
+        delta_call = dividend_discount * cdf_d1
+        theta_call = (
+            theta_decay - self.r * self.k * rate_discount * cdf_d2 + self.q * self.s * dividend_discount * cdf_d1
         )
-        d2 = d1 - self.sigma * np.sqrt(self.t)
+        rho_call = self.k * self.t * rate_discount * cdf_d2
 
+        # Put Greeks follow from the call ones via put-call parity: P = C - S*e^(-qT) + K*e^(-rT)
         greeks = {
-            "delta_call": np.exp(-self.q * self.t) * norm.cdf(d1),
-            "delta_put": -np.exp(-self.q * self.t) * norm.cdf(-d1),
-            "gamma": np.exp(-self.q * self.t) * norm.pdf(d1) / (self.s * self.sigma * np.sqrt(self.t)),
-            "vega": self.s * np.exp(-self.q * self.t) * norm.pdf(d1) * np.sqrt(self.t),
-            "theta_call": -self.s * np.exp(-self.q * self.t) * norm.pdf(d1) * self.sigma / (2 * np.sqrt(self.t))
-            - self.r * self.k * np.exp(-self.r * self.t) * norm.cdf(d2)
-            + self.q * self.s * np.exp(-self.q * self.t) * norm.cdf(d1),
-            "theta_put": -self.s * np.exp(-self.q * self.t) * norm.pdf(d1) * self.sigma / (2 * np.sqrt(self.t))
-            + self.r * self.k * np.exp(-self.r * self.t) * norm.cdf(-d2)
-            - self.q * self.s * np.exp(-self.q * self.t) * norm.cdf(-d1),
-            "rho_call": self.k * self.t * np.exp(-self.r * self.t) * norm.cdf(d2),
-            "rho_put": -self.k * self.t * np.exp(-self.r * self.t) * norm.cdf(-d2),
+            "delta_call": delta_call,
+            "delta_put": delta_call - dividend_discount,
+            "gamma": dividend_discount * pdf_d1 / (self.s * self.sigma * sqrt_t),
+            "vega": self.s * dividend_discount * pdf_d1 * sqrt_t,
+            "theta_call": theta_call,
+            "theta_put": theta_call + self.r * self.k * rate_discount - self.q * self.s * dividend_discount,
+            "rho_call": rho_call,
+            "rho_put": rho_call - self.k * self.t * rate_discount,
         }
         return greeks
 
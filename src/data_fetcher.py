@@ -1,5 +1,6 @@
 from contextlib import suppress
 from datetime import datetime, timedelta
+from functools import lru_cache
 from os import getenv
 
 import streamlit as st
@@ -20,6 +21,14 @@ def get_fred_api_key():
 fred = Fred(api_key=get_fred_api_key())
 
 
+@lru_cache(maxsize=64)
+def _fetch_series_last(series_id, day):
+    data = fred.get_series(series_id, day - timedelta(days=7), day).dropna()
+    if data.empty:
+        raise ValueError(f"No recent observations for FRED series {series_id}")
+    return float(data.iloc[-1])
+
+
 def get_risk_free_rate(maturity_years):
     series_map = {
         1 / 12: "DTB4WK",
@@ -38,52 +47,49 @@ def get_risk_free_rate(maturity_years):
     closest_maturity = min(series_map.keys(), key=lambda x: abs(x - maturity_years))
     series_id = series_map[closest_maturity]
 
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=7)
-
     try:
-        data = fred.get_series(series_id, start_date, end_date)
-        if not data.empty:
-            return float(data.iloc[-1]) / 100
-        else:
-            return 0.05
+        return _fetch_series_last(series_id, datetime.now().date()) / 100
     except Exception as e:
         print(f"Error fetching risk-free rate: {e}")
         return 0.05
 
 
-def fetch_stock_data(ticker):
-    try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        history = stock.history(period="1mo")
-
-        company_name = info.get("longName", ticker)
-        if not company_name or company_name == ticker:
-            company_name = info.get("shortName", ticker)
-
-        dividend_yield = 0.0
-        if "dividendYield" in info and info["dividendYield"] is not None:
-            raw_yield = float(info["dividendYield"])
-            dividend_yield = raw_yield / 100
-
-        current_price = 0.0
-        if "regularMarketPrice" in info and info["regularMarketPrice"] is not None:
-            current_price = float(info["regularMarketPrice"])
-        elif not history.empty:
-            current_price = float(history["Close"].iloc[-1])
+@st.cache_data(ttl=300)
+def _fetch_stock_data(ticker):
+    stock = yf.Ticker(ticker)
+    info = stock.info
+    history = stock.history(period="1mo")
+
+    company_name = info.get("longName", ticker)
+    if not company_name or company_name == ticker:
+        company_name = info.get("shortName", ticker)
+
+    dividend_yield = 0.0
+    if "dividendYield" in info and info["dividendYield"] is not None:
+        raw_yield = float(info["dividendYield"])
+        dividend_yield = raw_yield / 100
+
+    current_price = 0.0
+    if "regularMarketPrice" in info and info["regularMarketPrice"] is not None:
+        current_price = float(info["regularMarketPrice"])
+    elif not history.empty:
+        current_price = float(history["Close"].iloc[-1])
+
+    volatility = 0.0
+    if not history.empty and len(history) > 1:
+        volatility = float(history["Close"].pct_change().dropna().std() * (252**0.5))
+
+    return {
+        "current_price": current_price,
+        "volatility": volatility,
+        "dividend_yield": dividend_yield,  # Always decimal (e.g., 0.0067 for 0.67%)
+        "company_name": str(company_name),
+    }
 
-        volatility = 0.0
-        if not history.empty and len(history) > 1:
-            volatility = float(history["Close"].pct_change().dropna().std() * (252**0.5))
-
-        return {
-            "current_price": current_price,
-            "volatility": volatility,
-            "dividend_yield": dividend_yield,  # Always decimal (e.g., 0.0067 for 0.67%)
-            "company_name": str(company_name),
-        }
 
+def fetch_stock_data(ticker):
+    try:
+        return _fetch_stock_data(ticker)
     except Exception as e:
         print(f"Error fetching stock data: {e}")
         return {
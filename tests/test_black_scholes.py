@@ -1,4 +1,6 @@
+import numpy as np
 import pytest
+from scipy.stats import norm
 
 from src.black_scholes import BlackScholes
 
@@ -33,3 +35,53 @@ def test_profit_loss(bs_instance):
     put_pnl = bs_instance.calculate_profit_loss("put", 10, 90)
     assert call_pnl == 0, "Call PnL should be 0 when stock price equals strike plus premium"
     assert put_pnl == 0, "Put PnL should be 0 when stock price equals strike minus premium"
+
+
+def test_vectorized_option_price():
+    s_grid, sigma_grid = np.meshgrid(np.linspace(80, 120, 5), np.linspace(0.1, 0.4, 4))
+    bs_grid = BlackScholes(s=s_grid, k=100, t=1, r=0.05, sigma=sigma_grid, q=0.01)
+    for option_type in ["call", "put"]:
+        prices = bs_grid.calculate_option_price(option_type)
+        expected = np.array(
+            [
+                [BlackScholes(s, 100, 1, 0.05, sig, 0.01).calculate_option_price(option_type) for s in row_s]
+                for row_s, sig in zip(s_grid, sigma_grid[:, 0], strict=True)
+            ]
+        )
+        assert prices.shape == (4, 5)
+        assert np.allclose(prices, expected), f"Vectorized {option_type} prices should match scalar prices"
+
+
+def test_vectorized_greeks():
+    s_range = np.linspace(50, 150, 11)
+    greeks = BlackScholes(s=s_range, k=100, t=1, r=0.05, sigma=0.2, q=0.01).calculate_greeks()
+    for i, s in enumerate(s_range):
+        scalar_greeks = BlackScholes(s, 100, 1, 0.05, 0.2, 0.01).calculate_greeks()
+        for greek, values in greeks.items():
+            assert values.shape == s_range.shape
+            assert np.isclose(values[i], scalar_greeks[greek]), f"Vectorized {greek} should match scalar {greek}"
+
+
+@pytest.mark.parametrize("s", [100.0, np.linspace(50, 150, 11)])
+def test_put_call_parity(s):
+    k, t, r, sigma, q = 100, 1, 0.05, 0.2, 0.01
+    bs = BlackScholes(s, k, t, r, sigma, q)
+    greeks = bs.calculate_greeks()
+
+    d1 = (np.log(s / k) + (r - q + 0.5 * sigma**2) * t) / (sigma * np.sqrt(t))
+    d2 = d1 - sigma * np.sqrt(t)
+    put_price = k * np.exp(-r * t) * norm.cdf(-d2) - s * np.exp(-q * t) * norm.cdf(-d1)
+    delta_put = -np.exp(-q * t) * norm.cdf(-d1)
+    theta_put = (
+        -s * np.exp(-q * t) * norm.pdf(d1) * sigma / (2 * np.sqrt(t))
+        + r * k * np.exp(-r * t) * norm.cdf(-d2)
+        - q * s * np.exp(-q * t) * norm.cdf(-d1)
+    )
+    rho_put = -k * t * np.exp(-r * t) * norm.cdf(-d2)
+
+    parity_put = bs.calculate_option_price("call") - s * np.exp(-q * t) + k * np.exp(-r * t)
+    assert np.allclose(parity_put, put_price), "Put price from parity should match the closed-form put price"
+    assert np.allclose(bs.calculate_option_price("put"), put_price)
+    assert np.allclose(greeks["delta_put"], delta_put)
+    assert np.allclose(greeks["theta_put"], theta_put)
+    assert np.allclose(greeks["rho_put"], rho_put)
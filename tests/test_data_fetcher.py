@@ -1,7 +1,14 @@
 import pandas as pd
 import pytest
 
-from src.data_fetcher import fetch_stock_data, get_fred_api_key, get_risk_free_rate
+from src import data_fetcher
+from src.data_fetcher import (
+    _fetch_series_last,
+    _fetch_stock_data,
+    fetch_stock_data,
+    get_fred_api_key,
+    get_risk_free_rate,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -9,6 +16,12 @@ def mock_fred_api_key(monkeypatch):
     monkeypatch.setenv("FRED_API_KEY", "mock_api_key")
 
 
+@pytest.fixture(autouse=True)
+def clear_data_cache():
+    _fetch_stock_data.clear()
+    _fetch_series_last.cache_clear()
+
+
 def test_get_fred_api_key():
     assert get_fred_api_key() == "mock_api_key"
 
@@ -18,23 +31,52 @@ def test_get_risk_free_rate():
     assert 0 <= rate <= 0.1, f"Risk-free rate {rate} is out of expected range"
 
 
-@pytest.fixture
-def mock_yfinance(monkeypatch):
-    class MockTicker:
-        @property
-        def info(self):
-            return {
-                "regularMarketPrice": 150.0,
-                "dividendYield": 2.0,
-                "longName": "Test Company",
-            }
+def test_get_risk_free_rate_memoized_per_series(monkeypatch):
+    calls = []
+
+    def mock_get_series(series_id, start_date, end_date):
+        calls.append(series_id)
+        return pd.Series([4.2, 4.5])
+
+    monkeypatch.setattr(data_fetcher.fred, "get_series", mock_get_series)
+
+    # One and two month maturities both map to the 4-week T-bill series
+    assert get_risk_free_rate(1 / 12) == pytest.approx(0.045)
+    assert get_risk_free_rate(2 / 12) == pytest.approx(0.045)
+    assert calls == ["DTB4WK"]
+
+
+def test_get_risk_free_rate_empty_series_not_cached(monkeypatch):
+    monkeypatch.setattr(data_fetcher.fred, "get_series", lambda *args: pd.Series([], dtype=float))
+    assert get_risk_free_rate(1) == 0.05
+
+    monkeypatch.setattr(data_fetcher.fred, "get_series", lambda *args: pd.Series([3.9]))
+    assert get_risk_free_rate(1) == pytest.approx(0.039), "An empty FRED window should not be memoized"
+
+
+class MockTicker:
+    @property
+    def info(self):
+        return {
+            "regularMarketPrice": 150.0,
+            "dividendYield": 2.0,
+            "longName": "Test Company",
+        }
+
+    def history(self, period):
+        return pd.DataFrame({"Close": [149, 150, 151]})
 
-        def history(self, period):
-            return pd.DataFrame({"Close": [149, 150, 151]})
 
-    def mock_ticker(*args, **kwargs):
-        return MockTicker()
+def mock_ticker(*args, **kwargs):
+    return MockTicker()
 
+
+def mock_ticker_error(*args, **kwargs):
+    raise Exception("API Error")
+
+
+@pytest.fixture
+def mock_yfinance(monkeypatch):
     monkeypatch.setattr("yfinance.Ticker", mock_ticker)
 
 
@@ -48,9 +90,6 @@ def test_fetch_stock_data_success(mock_yfinance):
 
 
 def test_fetch_stock_data_failure(monkeypatch):
-    def mock_ticker_error(*args, **kwargs):
-        raise Exception("API Error")
-
     monkeypatch.setattr("yfinance.Ticker", mock_ticker_error)
 
     result = fetch_stock_data("TEST")
@@ -60,3 +99,13 @@ def test_fetch_stock_data_failure(monkeypatch):
         "dividend_yield": 0,
         "company_name": "TEST",
     }
+
+
+def test_fetch_stock_data_failure_not_cached(monkeypatch):
+    monkeypatch.setattr("yfinance.Ticker", mock_ticker_error)
+    assert fetch_stock_data("TEST")["current_price"] == 0
+
+    monkeypatch.setattr("yfinance.Ticker", mock_ticker)
+    result = fetch_stock_data("TEST")
+    assert result["current_price"] == 150.0, "A failed fetch should not be served from the cache"
+    assert result["company_name"] == "Test Company"